@@ -353,6 +353,12 @@ def create_dataloader(
         batch_size=1 if generate else config.batch_size,
         num_workers=config.dataloader_num_workers,
         prefetch_factor=config.dataloader_prefetch_factor,
+        # Pinned memory allows async non-blocking copies to the GPU, and
+        # persistent workers avoid respawning worker processes (and losing
+        # their prefetch queues) every time iteration restarts at an epoch
+        # boundary.
+        pin_memory=torch.cuda.is_available(),
+        persistent_workers=config.dataloader_num_workers > 0,
     )
 
 
@@ -6,16 +6,17 @@
 """
 Vocoder modeling framework.
 """
+import concurrent.futures
+import copy
 import difflib
-import glob
+import functools
 import json
-import math
 import os
-import signal
+import threading
 import time
 import warnings
-from collections import defaultdict
-from typing import Type, List, Union, Dict, Any, Optional, Iterator, Tuple
+from collections import defaultdict, deque
+from typing import Type, List, Union, Deque, Dict, Any, Optional, Iterator, Tuple
 
 import click
 
@@ -23,6 +24,7 @@ import datasets as datasets # @oss-only
 # @fb-only: import langtech.tts.vocoders.datasets as datasets 
 import numpy as np
 import torch
+import torch.utils.checkpoint
 
 from datasets import AUDIO_SAMPLE_RATE # @oss-only
 # @fb-only: from langtech.tts.vocoders.datasets import AUDIO_SAMPLE_RATE 
@@ -35,6 +37,7 @@ from utils import die_if, hard_exit # @oss-only
 
 from utils import read_audio, write_audio # @oss-only
 # @fb-only: from langtech.tts.vocoders.utils import read_audio, write_audio 
+import yaml
 from omegaconf import OmegaConf
 from pytorch_msssim import ssim
 from torch import Tensor
@@ -82,6 +85,75 @@ MAX_FIRST_ITERATION_DELAY = 600
 MAX_TRAINING_ITERATION_DELAY = 60
 
 
+class CUDAPrefetcher:
+    """
+    Wraps a batch iterator so that host-to-device copies overlap with compute.
+
+    While the current batch is being consumed on the default stream, the next
+    batch is copied to the GPU with non-blocking transfers on a dedicated
+    side stream, hiding the copy latency behind the model's compute. For the
+    transfers to actually be asynchronous, the underlying DataLoader should
+    produce tensors in pinned memory.
+    """
+
+    def __init__(self, iterator: Iterator[Tuple[Tensor, Tensor]]) -> None:
+        """
+        Create the prefetcher.
+
+        Construction is cheap; the first batch is only fetched on the first
+        __next__ call, so the slow initial fetch (which spawns DataLoader
+        workers) happens inside whatever watchdog window the caller has
+        armed around its iteration, not at construction time.
+
+        Args:
+          iterator: The iterator yielding (spectrogram, waveform) batches.
+        """
+        self.iterator = iterator
+        self.stream = torch.cuda.Stream()
+        self.next_spectrograms: Optional[Tensor] = None
+        self.next_waveforms: Optional[Tensor] = None
+        self.primed = False
+
+    def preload(self) -> None:
+        """
+        Start copying the next batch to the GPU on the side stream.
+        """
+        try:
+            spectrograms, waveforms = next(self.iterator)
+        except StopIteration:
+            self.next_spectrograms = None
+            self.next_waveforms = None
+            return
+
+        with torch.cuda.stream(self.stream):
+            self.next_spectrograms = spectrograms.cuda(non_blocking=True)
+            self.next_waveforms = waveforms.cuda(non_blocking=True)
+
+    def __iter__(self) -> "CUDAPrefetcher":
+        return self
+
+    def __next__(self) -> Tuple[Tensor, Tensor]:
+        """
+        Get the already-copied batch and kick off the copy of the next one.
+        """
+        if not self.primed:
+            self.primed = True
+            self.preload()
+
+        torch.cuda.current_stream().wait_stream(self.stream)
+        spectrograms = self.next_spectrograms
+        waveforms = self.next_waveforms
+        if spectrograms is None or waveforms is None:
+            raise StopIteration
+
+        # Make sure the side stream doesn't reuse this memory until the
+        # default stream is done with it.
+        spectrograms.record_stream(torch.cuda.current_stream())
+        waveforms.record_stream(torch.cuda.current_stream())
+        self.preload()
+        return spectrograms, waveforms
+
+
 class ConfigProtocol(Protocol):
     """
     Protocol Config classes must follow.
@@ -89,6 +161,15 @@ class ConfigProtocol(Protocol):
 
     dataset: datasets.DatasetConfig
 
+    # Whether to trade compute for activation memory by re-running
+    # checkpointed submodules during the backward pass.
+    use_gradient_checkpointing: bool = False
+
+    # Whether to train under automatic mixed precision. When set,
+    # train_step must return its loss without running backward; see
+    # Vocoder.backward_step.
+    amp: bool = False
+
     def __init__(self) -> None:
         """Create a new config object."""
 
@@ -100,6 +181,11 @@ class Vocoder(torch.nn.Module):
 
     command: str = ""
 
+    # Whether generate() accepts a batch of spectrograms and returns a
+    # batch of waveforms. Models that can only synthesize one sample at a
+    # time leave this False.
+    supports_batch_generation: bool = False
+
     def __init__(self, config: ConfigProtocol) -> None:
         """
         Initialize this vocoder model.
@@ -108,12 +194,17 @@ class Vocoder(torch.nn.Module):
         self.config = config
         self.register_buffer("global_step_buffer", torch.zeros((), dtype=torch.int32))
 
+        # Host-side mirror of global_step_buffer. The buffer is what gets
+        # saved and restored with checkpoints; reads go through this plain
+        # int so they don't force a device-to-host sync each time.
+        self._global_step: int = 0
+
     @property
     def global_step(self) -> int:
         """
         Global step as a regular integer.
         """
-        return int(self.global_step_buffer.cpu())  # pyre-ignore
+        return self._global_step
 
     @global_step.setter
     def global_step(self, value: int) -> None:
@@ -123,8 +214,56 @@ class Vocoder(torch.nn.Module):
         Args:
           value: New value to set global_step to.
         """
+        self._global_step = value
         self.global_step_buffer.fill_(value)
 
+    def checkpointed(self, function: Any, *args: Any) -> Any:
+        """
+        Run a function, recomputing it in the backward pass if gradient
+        checkpointing is enabled.
+
+        Subclass train_step implementations can route activation-heavy
+        blocks (e.g. residual stacks) through this helper; with
+        use_gradient_checkpointing set in the config, activations inside the
+        block are discarded after the forward pass and recomputed during
+        backward, roughly halving activation memory for a modest recompute
+        cost.
+
+        Args:
+          function: The function or module to run.
+          args: Tensor arguments to pass to the function.
+
+        Returns:
+          The output of the function.
+        """
+        if getattr(self.config, "use_gradient_checkpointing", False):
+            return torch.utils.checkpoint.checkpoint(function, *args)
+        return function(*args)
+
+    def backward_step(self, loss: Tensor, scaler: Any) -> None:
+        """
+        Run the backward pass and optimizer steps for mixed-precision
+        training.
+
+        Only called when the config enables `amp`. In that mode train_step
+        must return its loss without calling backward itself; this hook
+        scales the loss and steps every optimizer through the GradScaler so
+        FP16 gradients don't underflow. Schedulers remain the model's
+        responsibility, as in full-precision training. GAN-style models
+        with interleaved generator/discriminator updates should override
+        this.
+
+        Args:
+          loss: The unscaled loss returned by train_step.
+          scaler: The torch.cuda.amp.GradScaler owned by the training loop.
+        """
+        for opt, _sched in self.get_optimizers():
+            opt.zero_grad()
+        scaler.scale(loss).backward()
+        for opt, _sched in self.get_optimizers():
+            scaler.step(opt)
+        scaler.update()
+
     # ========================================
     # ========================================
     # Below are methods models must implement.
@@ -176,6 +315,11 @@ class Vocoder(torch.nn.Module):
         """
         Runs a single train step of the model.
 
+        When the config enables `amp`, this runs under autocast and must
+        return the loss without calling backward; the training loop then
+        invokes backward_step. Otherwise the model runs its own backward
+        pass and optimizer steps here as usual.
+
         Returns:
           A tuple containing overall model loss and a list of losses to log
           to Tensorboard. The first loss is printed to the console and logged
@@ -312,6 +456,34 @@ def cli_train(
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _load_yaml_cached(path: str, _mtime_ns: int, _size: int) -> Any:
+    """
+    Parse a YAML config file, memoized by path, mtime, and size.
+
+    Uses the libyaml-backed CSafeLoader when available, which is much faster
+    than the pure-Python SafeLoader that OmegaConf.load falls back to.
+    """
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, "r") as handle:
+        return OmegaConf.create(yaml.load(handle, Loader=loader))
+
+
+def load_config_yaml(path: str) -> Any:
+    """
+    Load a YAML config file, caching parses across calls.
+
+    Args:
+      path: Path to the YAML file.
+
+    Returns:
+      An OmegaConf config for the file. The file is only re-parsed when it
+      changes on disk; callers get a copy they are free to mutate.
+    """
+    stat = os.stat(path)
+    return copy.deepcopy(_load_yaml_cached(path, stat.st_mtime_ns, stat.st_size))
+
+
 def load_model(
     model_class: Type[Vocoder],
     model_dir: str,
@@ -346,19 +518,22 @@ def load_model(
     )
 
     config = OmegaConf.structured(model_class.default_config())
-    config.merge_with(OmegaConf.load(config_path))
+    config.merge_with(load_config_yaml(config_path))
     model = model_class(config)
     model.initialize()
 
+    # Move the model to the GPU before restoring so checkpoint tensors are
+    # loaded straight onto the device rather than bounced through CPU
+    # parameters that then get copied again.
+    if torch.cuda.is_available():
+        model.to("cuda")
+
     # Load checkpoint into model if model has been initialized.
     if checkpoint_path is None:
         checkpoint_path = last_checkpoint_path(model_dir)
     if checkpoint_path is not None:
         load_model_from_checkpoint(model, checkpoint_path)
 
-    if torch.cuda.is_available():
-        model.to("cuda")
-
     if eval_mode:
         model.eval()
 
@@ -386,16 +561,29 @@ def create_if_missing(
     # Load the config object from default config, YAML, and dotlist.
     config_file = model_name + ".yaml" if config_file is None else config_file
     default_config_path = get_default_config_path(config_file)
-    config = OmegaConf.structured(model_class.default_config())
-    config.merge_with(OmegaConf.load(default_config_path))
+
+    # Build the default config once; the stored-config comparison below
+    # reuses a copy instead of constructing it from scratch again.
+    default_config = OmegaConf.structured(model_class.default_config())
+    config = copy.deepcopy(default_config)
+    config.merge_with(load_config_yaml(default_config_path))
     config.merge_with_dotlist(config_updates)
 
     # Check if the config already exists.
     config_path = os.path.join(path, CONFIG_YAML)
     if os.path.exists(config_path):
         # If it exists, look for differences from the expected config.
-        old_config = OmegaConf.structured(model_class.default_config())
-        old_config.merge_with(OmegaConf.load(config_path))
+        old_config = default_config
+        old_config.merge_with(load_config_yaml(config_path))
+
+        # In the common case the configs match; a structural equality check
+        # is much cheaper than serializing both to YAML and diffing. The
+        # diff is only built to produce the error message on mismatch.
+        if OmegaConf.to_container(old_config, resolve=True) == OmegaConf.to_container(
+            config, resolve=True
+        ):
+            return
+
         differences = "\n".join(
             difflib.context_diff(
                 OmegaConf.to_yaml(old_config).split("\n"),
@@ -405,7 +593,7 @@ def create_if_missing(
             )
         )
         die_if(
-            bool(differences),
+            True,
             "Found difference between saved and expected config:\n" + differences,
         )
         return
@@ -542,6 +730,79 @@ def cli_evaluate(
         json.dump(metadata, handle)
 
 
+class TrainingWatchdog:
+    """
+    Kills the process if a training iteration hangs.
+
+    A daemon thread polls a deadline that the training loop pushes forward
+    at the start of every iteration and clears once the step has finished.
+    Unlike the SIGALRM watchdog this replaces, arming costs no syscall per
+    iteration and it works on platforms without SIGALRM.
+    """
+
+    # How often the watchdog thread checks the deadline, in seconds.
+    POLL_INTERVAL: float = 1.0
+
+    def __init__(self) -> None:
+        """
+        Create the watchdog and start its polling thread.
+        """
+        self.deadline: float = float("inf")
+        self.lock = threading.Lock()
+        threading.Thread(target=self._poll, daemon=True).start()
+
+    def arm(self, timeout: float) -> None:
+        """
+        Require the next disarm() to happen within a timeout.
+
+        Args:
+          timeout: How many seconds may elapse before the process is killed.
+        """
+        with self.lock:
+            self.deadline = time.monotonic() + timeout
+
+    def disarm(self) -> None:
+        """
+        Stop the countdown until the next arm().
+        """
+        with self.lock:
+            self.deadline = float("inf")
+
+    def _poll(self) -> None:
+        """
+        Poll the deadline forever, dying if it has passed.
+        """
+        while True:
+            time.sleep(self.POLL_INTERVAL)
+            with self.lock:
+                expired = time.monotonic() > self.deadline
+            if expired:
+                training_iteration_took_too_long()
+
+
+def ensure_fast_dataloader(dataloader: torch.utils.data.DataLoader) -> None:
+    """
+    Warn if a DataLoader is configured in a way that slows down training.
+
+    Args:
+      dataloader: The DataLoader to check. Training wants pin_memory (so
+        host-to-device copies can be asynchronous) and persistent_workers
+        (so worker processes survive epoch boundaries).
+    """
+    if torch.cuda.is_available() and not dataloader.pin_memory:
+        print(
+            "WARNING: DataLoader has pin_memory=False; "
+            "host-to-device copies will be synchronous.",
+            flush=True,
+        )
+    if dataloader.num_workers > 0 and not dataloader.persistent_workers:
+        print(
+            "WARNING: DataLoader has persistent_workers=False; "
+            "workers will be respawned every epoch.",
+            flush=True,
+        )
+
+
 # Linter complains that this function is too complex, but it's a bit tricky to
 # refactor it without making it more confusing to read, hence the 'noqa' below.
 def train_loop(  # noqa
@@ -563,102 +824,211 @@ def train_loop(  # noqa
       valid_set: A DataLoader for loading validation data.
       generate_set: A DataLoader for loading data to generate audio from.
     """
-    writer = SummaryWriter(log_dir=log_dir)
-
-    if torch.cuda.is_available():
-        # Move model to GPU.
-        model.to("cuda")
-        print("Moved model to GPU.")
-    else:
+    writer = SummaryWriter(log_dir=log_dir, max_queue=1000, flush_secs=60)
+
+    # Tensorboard scalars are buffered and written from a helper thread so
+    # that Summary protobuf construction and filesystem flushes stay off the
+    # training hot loop.
+    tb_queue: Deque[Tuple[str, float, int]] = deque()
+    tb_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    tb_future: Optional[concurrent.futures.Future] = None
+
+    # Checkpoint serialization runs on its own worker so torch.save doesn't
+    # block training; at most one save is in flight at a time.
+    save_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    save_future: Optional[concurrent.futures.Future] = None
+
+    ensure_fast_dataloader(train_set)
+    ensure_fast_dataloader(valid_set)
+
+    # The model is already on the GPU at this point; load_model moves it
+    # before restoring the checkpoint.
+    if not torch.cuda.is_available():
         print("WARNING: No GPU detected, running on CPU. Training may be very slow.")
 
     def repeat_training_data_forever() -> Iterator[Any]:
         """
         Repeat all training data forever.
+
+        Pulls batches through an explicit DataLoader iterator rather than
+        'yield from', so that (together with persistent_workers) worker
+        processes and their prefetch queues are reused across epoch
+        boundaries instead of being torn down and respawned.
         """
+        loader_iter = iter(train_set)
         while True:
-            yield from train_set
-            print("Completed epoch.", flush=True)
+            try:
+                yield next(loader_iter)
+            except StopIteration:
+                loader_iter = iter(train_set)
+                print("Completed epoch.", flush=True)
 
     total_start_time: Optional[float] = None
-    iter_start_time = time.time()
-    signal.signal(signal.SIGALRM, training_iteration_took_too_long)
+    iter_start_time = time.monotonic()
+    watchdog = TrainingWatchdog()
 
     data_loading_total_time = 0.0
     num_iterations = 0
 
-    train_iterator = repeat_training_data_forever()
+    # Optional mixed-precision training. Models opt in via config.amp, in
+    # which case their train_step returns the loss without running backward
+    # and Vocoder.backward_step handles scaling and optimizer steps.
+    amp_enabled = torch.cuda.is_available() and bool(
+        getattr(model.config, "amp", False)
+    )
+    scaler = torch.cuda.amp.GradScaler(enabled=amp_enabled)
+
+    # NaN detection is accumulated into an on-device flag each step, so no
+    # iteration between log points ever pays a host sync for it, and a NaN
+    # in any step since the last check is still caught.
+    nan_flag = torch.zeros(
+        (), dtype=torch.bool, device="cuda" if torch.cuda.is_available() else "cpu"
+    )
+
+    # Pinned staging buffer for the training loss. Copying into it is
+    # asynchronous, so the Python float is only materialized (with one
+    # explicit synchronization) when we actually log, instead of forcing a
+    # device sync on every iteration.
+    loss_host = torch.empty(
+        (), dtype=torch.float32, pin_memory=torch.cuda.is_available()
+    )
+
+    train_iterator: Iterator[Tuple[Tensor, Tensor]] = repeat_training_data_forever()
+    if torch.cuda.is_available():
+        # Overlap the host-to-device copy of the next batch with the current
+        # train step instead of copying synchronously in the loop below.
+        train_iterator = CUDAPrefetcher(train_iterator)
+
     while not model.is_done():
-        signal.alarm(
+        watchdog.arm(
             MAX_FIRST_ITERATION_DELAY
             if total_start_time is None
             else MAX_TRAINING_ITERATION_DELAY
         )
 
-        data_loading_start_time = time.time()
+        data_loading_start_time = time.monotonic()
         spectrograms, waveforms = next(train_iterator)
         if num_iterations > 0:
             # Skip the first iteration because it's very long and not representative.
-            data_loading_total_time += time.time() - data_loading_start_time
-
-        if torch.cuda.is_available():
-            spectrograms = spectrograms.cuda()
-            waveforms = waveforms.cuda()
-        loss, tb_logs = model.train_step(spectrograms, waveforms)
+            data_loading_total_time += time.monotonic() - data_loading_start_time
+
+        if amp_enabled:
+            with torch.cuda.amp.autocast():
+                loss, tb_logs = model.train_step(spectrograms, waveforms)
+            model.backward_step(loss, scaler)
+        else:
+            loss, tb_logs = model.train_step(spectrograms, waveforms)
+        loss_host.copy_(loss.detach(), non_blocking=True)
+        nan_flag |= torch.isnan(loss.detach())
         num_iterations += 1
         model.global_step += 1
 
-        # Print elapsed time.
+        # One monotonic read covers the per-iteration and total elapsed
+        # times; monotonic also can't jump backwards with wall-clock
+        # adjustments.
+        now = time.monotonic()
         if total_start_time is None:
-            total_start_time = time.time()
+            total_start_time = now
 
-        elapsed = time.time() - iter_start_time
-        elapsed_total = int((time.time() - total_start_time) / 60)
-        print_loss = float(loss.detach().cpu().numpy())
-        print(
-            f"{elapsed_total}m - {elapsed:.3f}s",
-            "-",
-            f"Iteration {model.global_step}: {print_loss:.3f}",
-            flush=True,
-        )
+        elapsed = now - iter_start_time
         if model.global_step % 50 == 0:
             print(
                 f"Average data loading time: {data_loading_total_time / num_iterations:.3f}"
             )
-        iter_start_time = time.time()
-        signal.alarm(0)
+        iter_start_time = now
+        watchdog.disarm()
 
         if model.global_step % LOG_FREQUENCY == 0:
-            writer.add_scalar("train/loss", print_loss, global_step=model.global_step)
+            # Make sure the async copy into the pinned buffer has landed
+            # before reading the scalar.
+            if torch.cuda.is_available():
+                torch.cuda.current_stream().synchronize()
+            print_loss = loss_host.item()
+
+            elapsed_total = int((now - total_start_time) / 60)
+            print(
+                f"{elapsed_total}m - {elapsed:.3f}s",
+                "-",
+                f"Iteration {model.global_step}: {print_loss:.3f}",
+                flush=True,
+            )
+
+            tb_queue.append(("train/loss", print_loss, model.global_step))
             for key, value in tb_logs.items():
-                writer.add_scalar("train/" + key, value, global_step=model.global_step)
+                tb_queue.append(("train/" + key, value, model.global_step))
 
-        if math.isnan(print_loss):
-            print("Detected NaN loss. Exiting!")
-            hard_exit(1)
+            # Drain the buffered scalars in one pass on the helper thread.
+            # Checking the previous batch's future re-raises any write
+            # failure on the training thread instead of swallowing it.
+            if tb_future is not None:
+                tb_future.result()
+            scalars = list(tb_queue)
+            tb_queue.clear()
+            tb_future = tb_executor.submit(write_scalars, writer, scalars)
+
+            if bool(nan_flag.item()):
+                print("Detected NaN loss. Exiting!")
+                hard_exit(1)
 
         if model.global_step % EVAL_FREQUENCY == 0:
             model.eval()
             compute_validation_metrics(model, valid_set, writer)
             model.train()
 
-            # Save model every time we eval.
-            save_model(model, checkpoint_dir)
+            # Save model every time we eval. The state is snapshotted to
+            # CPU here, but serialization happens in the background while
+            # training continues; wait for any previous save first so only
+            # one is ever in flight.
+            if save_future is not None:
+                save_future.result()
+            os.makedirs(checkpoint_dir, exist_ok=True)
+            save_future = save_executor.submit(
+                write_checkpoint,
+                snapshot_checkpoint(model),
+                os.path.join(checkpoint_dir, f"{model.global_step:08d}.ckpt"),
+            )
 
         if model.global_step % GENERATE_FREQUENCY == 0:
             generate_tensorboard_samples(model, generate_set, writer)
 
     print("Completed training.")
+    if save_future is not None:
+        save_future.result()
     save_model(model, checkpoint_dir)
+    save_executor.shutdown(wait=True)
+    if tb_future is not None:
+        tb_future.result()
+    tb_executor.shutdown(wait=True)
 
 
-def save_model(model: Vocoder, checkpoint_dir: str) -> None:
+def write_scalars(
+    writer: SummaryWriter, scalars: List[Tuple[str, float, int]]
+) -> None:
     """
-    Save the model to disk.
+    Write a batch of scalars to Tensorboard.
 
     Args:
-      model: The model to save.
-      checkpoint_dir: Directory in which to put checkpoint.
+      writer: Tensorboard to write to.
+      scalars: A list of (tag, value, global_step) tuples.
+    """
+    for tag, value, global_step in scalars:
+        writer.add_scalar(tag, value, global_step=global_step)
+
+
+def snapshot_checkpoint(model: Vocoder) -> Dict[str, Any]:
+    """
+    Capture a CPU copy of everything that goes into a checkpoint.
+
+    Must be called from the training thread while the model is not being
+    updated. The returned structure shares no storage with the live model,
+    so it can be serialized from a background thread while training
+    continues.
+
+    Args:
+      model: The model to snapshot.
+
+    Returns:
+      The checkpoint dictionary with all tensors on CPU.
     """
     optimizers, schedulers = [], []
     for opt, sched in model.get_optimizers():
@@ -671,12 +1041,63 @@ def save_model(model: Vocoder, checkpoint_dir: str) -> None:
         "lr_schedulers": schedulers,
     }
 
-    # Move checkpoint to CPU.
+    # Move checkpoint to CPU. The guard makes a traversal regression fail
+    # loudly here rather than letting the background save serialize live
+    # GPU state into a corrupt checkpoint.
     checkpoint = move_state_dict_to_device(checkpoint, cpu=True)
+    assert_no_cuda_tensors(checkpoint)
+    return checkpoint
+
+
+def assert_no_cuda_tensors(item: Union[Dict[str, Any], List[Any], Tensor]) -> None:
+    """
+    Assert that no tensor in a checkpoint structure lives on a CUDA device.
+
+    Args:
+      item: A Tensor or an arbitrarily nested list or dict of Tensors.
+
+    Raises:
+      AssertionError: If any tensor in the structure is on a CUDA device.
+    """
+    if isinstance(item, torch.Tensor):
+        assert not item.is_cuda, "Checkpoint snapshot contains a CUDA tensor"
+    elif isinstance(item, dict):
+        for value in item.values():
+            assert_no_cuda_tensors(value)
+    elif isinstance(item, list):
+        for value in item:
+            assert_no_cuda_tensors(value)
+
+
+def write_checkpoint(checkpoint: Dict[str, Any], checkpoint_path: str) -> None:
+    """
+    Serialize a checkpoint to disk atomically.
+
+    Writes to a temporary file next to the target and renames it into
+    place, so a crash mid-write can't leave a truncated checkpoint where
+    last_checkpoint_path would find it.
+
+    Args:
+      checkpoint: The checkpoint dictionary, with all tensors on CPU.
+      checkpoint_path: Where to write the checkpoint.
+    """
+    temp_path = checkpoint_path + ".tmp"
+    torch.save(checkpoint, temp_path, _use_new_zipfile_serialization=True)
+    os.replace(temp_path, checkpoint_path)
+
+
+def save_model(model: Vocoder, checkpoint_dir: str) -> None:
+    """
+    Save the model to disk.
 
+    Args:
+      model: The model to save.
+      checkpoint_dir: Directory in which to put checkpoint.
+    """
     os.makedirs(checkpoint_dir, exist_ok=True)
-    torch.save(
-        checkpoint, os.path.join(checkpoint_dir, f"{model.global_step:08d}.ckpt")
+    write_checkpoint(
+        snapshot_checkpoint(model),
+        os.path.join(checkpoint_dir, f"{model.global_step:08d}.ckpt"),
     )
 
 
@@ -685,27 +1106,53 @@ def move_state_dict_to_device(
     cpu: bool,
 ) -> Union[Dict[str, Any], List[Any], Tensor]:
     """
-    Recursively move a state_dict to CPU.
+    Move all tensors in a state_dict to the target device.
 
     Args:
-      item: The item to move to CPU. Can be a Tensor or a list or dict.
-        If it's a list or dict, recurse. If it's a tensor, move it to CPU.
-        If it's anything else, do nothing and return the input value.
+      item: The item to move. Can be a Tensor or an arbitrarily nested
+        list or dict of Tensors; non-tensor leaves are returned unchanged.
       cpu: Whether to move to CPU (true) or GPU (false).
 
     Returns:
       A structure identical to the input but with all tensors moved to CPU.
+      When moving to CPU, the returned tensors never share storage with
+      the input, so the result is safe to serialize while training
+      continues.
     """
-    if isinstance(item, torch.Tensor):
-        return item.cpu() if cpu else item.cuda()
-    if isinstance(item, dict):
-        return {
-            key: move_state_dict_to_device(value, cpu=cpu)
-            for key, value in item.items()
-        }
-    if isinstance(item, list):
-        return [move_state_dict_to_device(value, cpu=cpu) for value in item]
-    return item
+    # All copies below are issued without blocking; synchronize once at the
+    # end instead of once per tensor. isinstance-based traversal is used
+    # deliberately: state_dicts are OrderedDicts, which torch 1.9's
+    # _pytree does not register as a container type.
+    def move(value: Any) -> Any:
+        if isinstance(value, torch.Tensor):
+            if cpu and value.is_cuda:
+                # Device-to-host copies are only asynchronous when the
+                # destination is pinned; .to('cpu') would allocate pageable
+                # memory and block until each individual copy completes.
+                staging = torch.empty(
+                    value.shape, dtype=value.dtype, pin_memory=True
+                )
+                staging.copy_(value, non_blocking=True)
+                return staging
+            if cpu:
+                # .to('cpu') on a tensor already on CPU is a no-op that
+                # returns the live tensor. Snapshots taken here get
+                # serialized from a background thread while training keeps
+                # stepping the parameters, so clone to guarantee the result
+                # never aliases live state.
+                return value.clone()
+            return value.to("cuda", non_blocking=True)
+        if isinstance(value, dict):
+            # Preserve the dict subclass; state_dicts are OrderedDicts.
+            return type(value)((key, move(child)) for key, child in value.items())
+        if isinstance(value, list):
+            return [move(child) for child in value]
+        return value
+
+    moved = move(item)
+    if torch.cuda.is_available():
+        torch.cuda.synchronize()
+    return moved
 
 
 def load_model_from_checkpoint(model: Vocoder, checkpoint_path: str) -> None:
@@ -717,22 +1164,43 @@ def load_model_from_checkpoint(model: Vocoder, checkpoint_path: str) -> None:
       checkpoint_path: The path to the checkpoint.
     """
     print(f"Loading model from checkpoint: {checkpoint_path}")
-    checkpoint = torch.load(checkpoint_path)
 
-    if torch.cuda.is_available():
-        checkpoint = move_state_dict_to_device(checkpoint, cpu=False)
+    # Deserialize straight onto the target device instead of materializing
+    # every tensor on CPU first and copying it over afterwards, which
+    # doubles both the copies and the peak host memory.
+    checkpoint = torch.load(
+        checkpoint_path,
+        map_location="cuda" if torch.cuda.is_available() else "cpu",
+    )
 
     # Check that we don't have NaN in the checkpoint.
-    # This should never happen; this is a sanity check.
-    for key, tensor in checkpoint["model"].items():
-        if isinstance(tensor, torch.Tensor):
-            assert not torch.any(
-                torch.isnan(tensor)
-            ), f"Found NaN in checkpoint tensor {key}"
+    # This should never happen; this is a sanity check. A single reduction
+    # per tensor plus one stacked isfinite check keeps this to one
+    # host-device sync total, instead of an isnan+any kernel pair and a
+    # sync per parameter.
+    float_keys = [
+        key
+        for key, tensor in checkpoint["model"].items()
+        if isinstance(tensor, torch.Tensor) and tensor.is_floating_point()
+    ]
+    if float_keys:
+        sums = torch.stack([checkpoint["model"][key].sum() for key in float_keys])
+        finite = torch.isfinite(sums)
+        if not bool(torch.all(finite)):
+            bad_keys = [
+                key for key, ok in zip(float_keys, finite.tolist()) if not ok
+            ]
+            raise AssertionError(f"Found NaN in checkpoint tensors {bad_keys}")
 
     # All checks have passed. Load the state_dict.
     model.load_state_dict(checkpoint["model"], strict=False)
 
+    # Refresh the host-side global step mirror from the restored buffer.
+    # This is the one place where reading the buffer pays a sync.
+    model._global_step = int(  # pylint: disable=protected-access
+        model.global_step_buffer.item()
+    )
+
     for (opt, sched), opt_dict, sched_dict in zip(
         model.get_optimizers(), checkpoint["optimizers"], checkpoint["lr_schedulers"]
     ):
@@ -753,20 +1221,27 @@ def last_checkpoint_path(model_dir: str) -> Optional[str]:
       If no checkpoints exist, return None.
     """
     checkpoint_dir = os.path.join(model_dir, CHECKPOINT_DIR)
-    checkpoint_paths = sorted(glob.glob(os.path.join(checkpoint_dir, "*.ckpt")))
-    if checkpoint_paths:
-        return checkpoint_paths[-1]
-    return None
+    if not os.path.isdir(checkpoint_dir):
+        return None
+
+    # Checkpoint filenames are zero-padded step numbers, so the lexical
+    # maximum is the latest; a single scandir pass avoids glob's per-entry
+    # stat calls and the full sort.
+    with os.scandir(checkpoint_dir) as entries:
+        return max(
+            (entry.path for entry in entries if entry.name.endswith(".ckpt")),
+            default=None,
+        )
 
 
-def training_iteration_took_too_long(_signum: int, _frame: Any) -> None:
+def training_iteration_took_too_long() -> None:
     """
-    Signal handler for SIGALARM.
+    Called from the watchdog thread when a training iteration takes too long.
 
-    Called when a training iteration takes too long. This signal handler is
-    registered because a training iteration that takes more than a minute or
-    two is likely indicative of a hang, and so to prevent FBLearner Flow from running
-    an expensive job forever and not reporting a failure, we instead kill the process.
+    A training iteration that takes more than a minute or two is likely
+    indicative of a hang, and so to prevent FBLearner Flow from running
+    an expensive job forever and not reporting a failure, we instead kill
+    the process.
     """
     print("Iteration took too long!", flush=True)
     hard_exit(1)
@@ -787,14 +1262,26 @@ def generate_tensorboard_samples(
     """
     # Generate the samples from the model.
     with torch.no_grad():
-        ground_truth = []
-        generated = []
-        for spec, wav in dataloader:
-            ground_truth.append(wav)
+        data = list(dataloader)
+        ground_truth = [wav for _spec, wav in data]
+        specs = [spec for spec, _wav in data]
 
-            if torch.cuda.is_available():
-                spec = spec.cuda()
-            generated.append(model.generate(spec, True))
+        if torch.cuda.is_available():
+            specs = [spec.cuda(non_blocking=True) for spec in specs]
+
+        # Generating all samples as one batch amortizes per-step Python and
+        # kernel-launch overhead across them, but is only possible when the
+        # model supports batched generation and the spectrograms share a
+        # shape (the generation set holds whole utterances, so lengths
+        # usually differ).
+        if (
+            model.supports_batch_generation
+            and len(specs) > 1
+            and len({spec.shape for spec in specs}) == 1
+        ):
+            generated = list(model.generate(torch.cat(specs, dim=0), True).unbind(0))
+        else:
+            generated = [model.generate(spec, True) for spec in specs]
 
     # Write samples, including original if needed, to Tensorboard.
     for idx, wav in enumerate(generated):
@@ -831,19 +1318,34 @@ def compute_validation_metrics(
     losses = []
     print("Computing validation loss...", flush=True)
 
-    for spectrograms, waveforms in dataloader:
-        if torch.cuda.is_available():
-            spectrograms = spectrograms.cuda()
-            waveforms = waveforms.cuda()
-        losses.append(model.validation_losses(spectrograms, waveforms))
+    amp_enabled = torch.cuda.is_available() and bool(
+        getattr(model.config, "amp", False)
+    )
+
+    batches: Iterator[Tuple[Tensor, Tensor]] = iter(dataloader)
+    if torch.cuda.is_available():
+        # Copy the next batch to the GPU on a side stream while the current
+        # batch's losses are computed, same as the training loop.
+        batches = CUDAPrefetcher(batches)
+
+    for spectrograms, waveforms in batches:
+        with torch.cuda.amp.autocast(enabled=amp_enabled):
+            losses.append(model.validation_losses(spectrograms, waveforms))
 
     if not losses:
         print("No validation data available!")
         return
 
-    for key in sorted(losses[0].keys()):
-        key_losses = [batch_losses[key] for batch_losses in losses]
-        mean_loss = torch.mean(torch.stack(key_losses)).cpu().numpy().item()
+    # Reduce all keys on device and transfer the means to the host in a
+    # single copy instead of one .cpu() per key.
+    keys = sorted(losses[0].keys())
+    mean_losses = torch.stack(
+        [
+            torch.mean(torch.stack([batch_losses[key] for batch_losses in losses]))
+            for key in keys
+        ]
+    ).cpu()
+    for key, mean_loss in zip(keys, mean_losses.tolist()):
         print(f"Validation {key}: {mean_loss:.3f}", flush=True)
         writer.add_scalar("valid/" + key, mean_loss, global_step=model.global_step)
 